@@ -1,169 +1,584 @@
 import os
+import sys
 import json
 import re
 import random
-from typing import Dict, List, Tuple
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from flask import Flask, render_template, request, jsonify
 from transformers import AutoTokenizer, AutoModelForQuestionAnswering, pipeline
 
 # Initialize Flask application
 app = Flask(__name__)
 
-class GossipGirlFinanceBot:
-    def __init__(self, knowledge_base_path: str = "financial_knowledge.json"):
+# Question answering model shared by every knowledge base and persona
+QA_MODEL_NAME = "distilbert-base-cased-distilled-squad"
+
+# Names of the built-in knowledge base and persona
+DEFAULT_KNOWLEDGE_BASE_NAME = "financial"
+DEFAULT_PERSONA_NAME = "gossip"
+
+# Memory budget for loaded knowledge bases; idle ones are evicted beyond it
+KB_MEMORY_BUDGET_MB = float(os.environ.get("KB_MEMORY_BUDGET_MB", "64"))
+
+# Optional JSON file registering extra knowledge bases and personas
+REGISTRY_CONFIG_PATH = os.environ.get("BOT_REGISTRY_CONFIG", "bot_registry.json")
+
+# Gossip Girl styled knowledge base written out when financial_knowledge.json is missing
+DEFAULT_KNOWLEDGE_BASE = {
+    "mutual fund": "A mutual fund is the ultimate Upper East Side investment clique, darling. Investors pool their money, and a financial Chuck Bass makes all the decisions—stocks, bonds, the whole portfolio. Everyone shares in the wins, the losses, and of course, the management fees. Because even in finance, nothing comes for free.",
+    "stock": "A stock is like holding a VIP pass to a company’s success—own a share, own a piece. The more you have, the more influence you wield, just like Blair Waldorf at Constance. Play it right, and your investment climbs faster than Serena’s social status. But beware, stocks can fall just as fast as they rise.",
+    "bond": "A bond is like lending cash to a government or corporation with the promise of getting paid back—with interest, of course. Less risky than stocks, but also less thrilling—think Nate Archibald over Chuck Bass. Old money adores bonds because they value stability over scandal.",
+    "401k": "A 401(k) is the trust fund you actually have to build yourself. Your employer sets it up, you contribute pre-tax dollars, and it grows until retirement—tax-free, of course. Think of it as securing your future penthouse, because even the elite plan ahead.",
+    "ira": "An IRA is your personal financial safety net, no trust fund required. Choose Traditional to delay taxes, or Roth to pay now and withdraw tax-free later. Either way, it’s like choosing between drama now or drama later—both have their perks.",
+    "etf": "An ETF is like a front-row seat to the stock market’s best players. It’s a mix of investments traded throughout the day—unlike mutual funds, which only trade once. Instant diversification, zero commitment. Sounds a lot like Serena’s dating strategy.",
+    "inflation": "Inflation is the reason your money buys less each year—think of it as designer prices creeping up season after season. Central banks fight it by raising interest rates, but too much control? That’s a fashion disaster waiting to happen.",
+    "compound interest": "Compound interest is the ultimate financial glow-up—earn interest on your interest, and watch your money multiply faster than Gossip Girl rumors. The longer you let it work, the bigger the payoff. Patience, darling, is a wealth-building virtue.",
+    "diversification": "Diversification is the golden rule of investing—never put all your social capital, or money, in one place. Stocks, bonds, real estate—mix it up. If one crashes, the others keep you afloat. The old-money elite have been doing this for generations.",
+    "credit score": "Your credit score is your financial reputation, darling. One bad move—missed payments, too much debt—and it haunts you like a Gossip Girl blast. Keep it high, and doors (and exclusive credit cards) open effortlessly.",
+    "roth ira": "A Roth IRA is like prepaying for luxury now so you can enjoy it tax-free later. You contribute already-taxed income, but future withdrawals? Totally untaxed. The Upper East Side calls that smart planning. New money should take notes.",
+    "bull market": "A bull market is the Wall Street version of Fashion Week—everyone’s thriving, stocks are soaring, and fortunes are multiplying. But like any party, it won’t last forever. The smartest investors know when to step out before the crash.",
+    "bear market": "A bear market is when stock prices drop at least 20%, and suddenly, everyone’s panicking. Think of it as social exile—reputations (and portfolios) take a hit, but the strong always make a comeback. The question is: are you patient enough to wait?",
+    "liquidity": "Liquidity is how quickly you can turn assets into cash—because sometimes, you need an emergency shopping spree at Bergdorf’s. Cash? Instantly liquid. A Hamptons mansion? Not so much. The truly wealthy keep a balance of both.",
+    "dividend": "A dividend is passive income at its finest—companies sharing profits with shareholders like an elite allowance. Old money loves them because they don’t have to lift a finger. Blair Waldorf would definitely approve.",
+    "portfolio": "Your portfolio is your financial wardrobe—diverse, strategic, and tailored to your goals. Stocks for drama, bonds for stability, maybe some real estate for flair. The key? Balance. Even the most fashionable icons mix classic with trendy.",
+    "hedge fund": "A hedge fund is the VIP after-party of investing—exclusive, high-stakes, and only for the wealthy. They use complex strategies to win big, no matter the market. Risky? Absolutely. But the elite never play it safe.",
+    "private equity": "Private equity is next-level investing—buying entire companies instead of just shares. It’s like acquiring a whole fashion empire instead of just a designer handbag. Requires serious money, but the returns? Très chic.",
+    "venture capital": "Venture capital is betting on the next big thing before it’s cool—funding startups in hopes of discovering the next Uber or Instagram. High risk, but if it pays off? You’re looking at generational wealth. Very Bass Industries.",
+    "asset allocation": "Asset allocation is like curating the perfect guest list—balance is key. Stocks for excitement, bonds for stability, and cash for security. The mix depends on your risk tolerance—are you a safe Lily or a bold Chuck?",
+    "market capitalization": "Market cap ranks companies like social status on the Upper East Side. Large caps are the Blairs and Serenas—established, powerful. Mid caps? Nates and Chucks—rising stars. Small caps? Jenny Humphreys—high risk, high reward.",
+    "dollar cost averaging": "Dollar cost averaging is playing the long game—investing steadily instead of all at once. It smooths out the highs and lows, so you’re not caught buying at the worst time. Think of it as effortless, drama-free investing.",
+    "index fund": "An index fund is the ultimate set-it-and-forget-it investment—like letting Dorota handle your social calendar. It tracks the market automatically, has low fees, and delivers solid returns. Even Warren Buffett approves.",
+    "rebalancing": "Rebalancing is the key to maintaining power—er, wealth. Over time, some investments overperform while others lag. Adjusting your portfolio keeps it in check. Even the elite refine their strategies regularly.",
+    "capital gain": "A capital gain is making money off an investment—buy low, sell high, cash in. Hold for over a year, and you get tax perks. The truly wealthy play the long game, just like in high society.",
+    "capital loss": "A capital loss is selling an investment for less than you paid—financial heartbreak, but sometimes useful. You can use it to lower your tax bill. Even a scandal can be spun into something beneficial.",
+    "tax-loss harvesting": "Tax-loss harvesting is using one financial loss to offset another—think of it as damage control. Sell underperforming assets, claim the loss, and reinvest smartly. Even the IRS allows a well-executed redemption arc.",
+    "emergency fund": "An emergency fund is your financial safety net—cash reserves to avoid selling investments or taking on debt when life happens. Old money keeps them, new money forgets. Be old money, darling.",
+    "robo-advisor": "A robo-advisor is like having an algorithm for a financial planner—no emotions, no drama, just automated investing based on your goals. Perfect for those who prefer efficiency over human error.",
+    "yield": "Yield is your investment’s performance score—how much you’re earning from dividends or interest. Higher yield? More rewards, but often more risk. The key is knowing when to go big and when to play it safe."
+}
+
+# normal definitions
+DEFAULT_NORMAL_DEFINITIONS = {
+    "mutual fund": "A mutual fund is a pool of money collected from multiple investors that is professionally managed and invested in various securities like stocks, bonds, and other assets. The fund manager makes investment decisions on behalf of all investors, who share in the profits, losses, and expenses proportionally.",
+    "stock": "A stock represents partial ownership in a company, giving shareholders a claim on its assets and earnings. Stocks are bought and sold on stock exchanges, and their value fluctuates based on company performance and market conditions.",
+    "bond": "A bond is a fixed-income investment where an investor loans money to a government or corporation for a set period in exchange for periodic interest payments and the return of the principal amount at maturity.",
+    "401k": "A 401(k) is a retirement savings plan sponsored by an employer, allowing employees to contribute pre-tax income, which grows tax-deferred until withdrawal, typically after retirement.",
+    "ira": "An Individual Retirement Account (IRA) is a tax-advantaged account that helps individuals save for retirement. Traditional IRAs allow tax-deductible contributions, while Roth IRAs offer tax-free withdrawals.",
+    "etf": "An Exchange-Traded Fund (ETF) is an investment fund that holds a collection of securities, such as stocks or bonds, and trades on stock exchanges like a stock. ETFs provide diversification and lower expense ratios compared to mutual funds.",
+    "inflation": "Inflation is the rate at which the general level of prices for goods and services rises over time, reducing the purchasing power of money.",
+    "compound interest": "Compound interest is the process where interest is added to the initial principal amount, and future interest is earned on both the principal and the accumulated interest, leading to exponential growth over time.",
+    "diversification": "Diversification is an investment strategy that involves spreading investments across different asset classes to reduce risk. A well-diversified portfolio minimizes potential losses by avoiding overconcentration in a single asset.",
+    "credit score": "A credit score is a numerical representation of a person’s creditworthiness, based on their credit history, debt levels, and payment behavior. It affects loan approvals, interest rates, and financial opportunities.",
+    "roth ira": "A Roth IRA is a retirement savings account where contributions are made with after-tax income, allowing tax-free withdrawals in retirement, provided certain conditions are met.",
+    "bull market": "A bull market refers to a prolonged period of rising stock prices, often driven by strong economic conditions, investor confidence, and increasing corporate profits.",
+    "bear market": "A bear market is a period when stock prices decline by at least 20% from recent highs, often due to economic downturns, declining investor confidence, or external financial shocks.",
+    "liquidity": "Liquidity refers to how easily an asset can be converted into cash without significantly affecting its price. Cash is the most liquid asset, while real estate and certain investments are less liquid.",
+    "dividend": "A dividend is a portion of a company's earnings distributed to shareholders, usually in cash or additional shares, as a reward for investing in the company.",
+    "portfolio": "A portfolio is a collection of financial assets, such as stocks, bonds, mutual funds, and real estate, that an investor owns. A well-balanced portfolio is key to managing risk and achieving financial goals.",
+    "hedge fund": "A hedge fund is an alternative investment vehicle that pools capital from accredited investors to employ various strategies, such as long-short positions and derivatives, to maximize returns while managing risk.",
+    "private equity": "Private equity refers to investments in privately held companies or buyouts of publicly traded companies, often involving direct investment strategies and active management to improve financial performance.",
+    "venture capital": "Venture capital is a form of private equity financing provided to startups and early-stage companies with high growth potential in exchange for equity ownership.",
+    "asset allocation": "Asset allocation is the process of dividing an investment portfolio among different asset categories, such as stocks, bonds, and cash, to balance risk and reward according to an investor’s goals and risk tolerance.",
+    "market capitalization": "Market capitalization (market cap) is the total value of a company’s outstanding shares, calculated by multiplying the stock price by the number of shares outstanding. It indicates a company's size and market value.",
+    "dollar cost averaging": "Dollar-cost averaging is an investment strategy where an investor regularly invests a fixed amount of money into a particular asset, regardless of its price, reducing the impact of market fluctuations over time.",
+    "index fund": "An index fund is a type of mutual fund or ETF designed to track the performance of a specific market index, such as the S&P 500. It provides broad market exposure and low costs.",
+    "rebalancing": "Rebalancing is the process of adjusting the allocation of assets in an investment portfolio to maintain the desired level of risk and return as market conditions change.",
+    "capital gain": "A capital gain is the profit earned when an asset, such as a stock or real estate, is sold for more than its purchase price. Long-term capital gains often receive favorable tax treatment.",
+    "capital loss": "A capital loss occurs when an asset is sold for less than its purchase price. Capital losses can offset capital gains for tax purposes, reducing taxable income.",
+    "tax-loss harvesting": "Tax-loss harvesting is a strategy where investors sell securities at a loss to offset capital gains, reducing their overall tax liability while maintaining an investment strategy.",
+    "emergency fund": "An emergency fund is a reserve of liquid assets set aside to cover unexpected financial expenses, such as medical emergencies or job loss, providing financial security and stability.",
+    "robo-advisor": "A robo-advisor is an automated platform that provides investment management services using algorithms to create and manage portfolios based on an investor's risk tolerance and goals.",
+    "yield": "Yield refers to the income generated from an investment, typically expressed as a percentage. It includes interest from bonds and dividends from stocks, indicating an investment’s profitability."
+}
+
+# Gossip Girl persona style pack
+DEFAULT_PERSONA = {
+    "intros": [
+        "Hello Upper East Siders. Gossip Girl here, your one and only financial source into the scandalous lives of Manhattan's elite. ",
+        "Spotted: Your favorite financial insider with some juicy money tea. ",
+        "Hey there, financial wannabes. Ready for today's most exclusive fiscal dirt? ",
+        "Good morning, Money Mavens. Word on the street is someone's asking about their finances. ",
+        "Breaking news from the financial district, and you heard it here first. ",
+        "Attention Upper East Siders, I have the ultimate scoop on what's happening in the money world. "
+    ],
+    "outros": [
+        " You know you love me. XOXO, Financial Girl.",
+        " And who am I? That's one secret I'll never tell. You know you love my financial advice.",
+        " Spotted: You, making smarter money moves after this little chat.",
+        " Whether you're old money or new money, now you're in the know.",
+        " And that's the kind of wealth management that keeps you on the social register.",
+        " Until next time, keep your friends close and your investments closer."
+    ],
+    "greeting": "Hello there! I'm your exclusive source into the scandalous lives of financial terms. What money gossip can I spill today?",
+    "farewell": "You know you'll miss me. Until next time, XOXO, Financial Girl.",
+    "default_responses": [
+        "Even Gossip Girl doesn't have all the financial tea on that. Try asking about specific terms like 'robo-advisor' or 'yield'. I promise the scandal is worth it.",
+        "That's not in my financial diary yet. I'm more versed in terms like 'robo-advisor' or 'yield'. Ask me about those instead, and I'll spill all the details.",
+        "That financial query is more mysterious than Gossip Girl's identity. Try something like 'What is yield?' or 'Tell me about robo-advisors' instead.",
+        "That's not trending in my financial circles yet. But I have plenty of gossip on 'robo-advisors' or 'yield' if you're interested."
+    ]
+}
+
+_qa_pipeline = None
+_qa_pipeline_lock = threading.Lock()
+
+def get_qa_pipeline():
+    """Return the process-wide QA pipeline, loading DistilBERT on first use"""
+    global _qa_pipeline
+    with _qa_pipeline_lock:
+        if _qa_pipeline is None:
+            tokenizer = AutoTokenizer.from_pretrained(QA_MODEL_NAME)
+            model = AutoModelForQuestionAnswering.from_pretrained(QA_MODEL_NAME)
+            _qa_pipeline = pipeline('question-answering', model=model, tokenizer=tokenizer)
+        return _qa_pipeline
+
+def _estimate_size(obj, seen: Optional[set] = None) -> int:
+    """Approximate the memory used by an object and everything it contains, in bytes"""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_estimate_size(key, seen) + _estimate_size(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_estimate_size(item, seen) for item in obj)
+    return size
+
+def _load_string_dict(file_path: str) -> Dict[str, str]:
+    """Load a JSON file that must hold an object mapping strings to strings"""
+    with open(file_path, 'r') as file:
+        data = json.load(file)
+    if not isinstance(data, dict) or not all(isinstance(key, str) and isinstance(value, str) for key, value in data.items()):
+        raise ValueError(f"{file_path} must contain a JSON object mapping topics to text")
+    return data
+
+class RegistryLoadError(Exception):
+    """Raised when a registered knowledge base or persona cannot be loaded from its file"""
+
+class KnowledgeBase:
+    def __init__(self, name: str, path: str, normal_definitions_path: Optional[str] = None,
+                 default_entries: Optional[Dict] = None, default_normal_definitions: Optional[Dict] = None):
         """
-        Initialize the Gossip Girl-themed Financial Chatbot
+        Load a named knowledge base and build its lookup index
         
         Args:
-            knowledge_base_path: Path to the JSON file containing financial information
-        """
-        self.knowledge_base = self._load_knowledge_base(knowledge_base_path)
-        
-        # Initialize the NLP model for question answering
-        self.tokenizer = AutoTokenizer.from_pretrained("distilbert-base-cased-distilled-squad")
-        self.model = AutoModelForQuestionAnswering.from_pretrained("distilbert-base-cased-distilled-squad")
-        self.qa_pipeline = pipeline('question-answering', model=self.model, tokenizer=self.tokenizer)
+            name: Name the knowledge base is registered under
+            path: Path to the JSON file containing the topics and their descriptions
+            normal_definitions_path: Optional JSON file with plain definitions for the "normal" style
+            default_entries: Topics written to path if the file is missing or unreadable
+            default_normal_definitions: Plain definitions used when no normal_definitions_path is given
         
-        # Initialize greeting and farewell phrases
-        self.greeting_phrases = ["hello", "hi", "hey", "greetings", "howdy"]
-        self.farewell_phrases = ["bye", "goodbye", "exit", "quit", "see you"]
+        Raises:
+            RegistryLoadError: If a file cannot be read and there are no defaults to fall back to
+        """
+        self.name = name
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries = self._load_knowledge_base(path, default_entries)
+        self.normal_definitions = self._load_normal_definitions(normal_definitions_path, default_normal_definitions)
         
-        # Gossip Girl intros
-        self.gossip_intros = [
-            "Hello Upper East Siders. Gossip Girl here, your one and only financial source into the scandalous lives of Manhattan's elite. ",
-            "Spotted: Your favorite financial insider with some juicy money tea. ",
-            "Hey there, financial wannabes. Ready for today's most exclusive fiscal dirt? ",
-            "Good morning, Money Mavens. Word on the street is someone's asking about their finances. ",
-            "Breaking news from the financial district, and you heard it here first. ",
-            "Attention Upper East Siders, I have the ultimate scoop on what's happening in the money world. "
-        ]
-        
-        # Gossip Girl outros
-        self.gossip_outros = [
-            " You know you love me. XOXO, Financial Girl.",
-            " And who am I? That's one secret I'll never tell. You know you love my financial advice.",
-            " Spotted: You, making smarter money moves after this little chat.",
-            " Whether you're old money or new money, now you're in the know.",
-            " And that's the kind of wealth management that keeps you on the social register.",
-            " Until next time, keep your friends close and your investments closer."
-        ]
-        
-        # normal definitions
-        self.normal_definitions = {
-
-            "mutual fund": "A mutual fund is a pool of money collected from multiple investors that is professionally managed and invested in various securities like stocks, bonds, and other assets. The fund manager makes investment decisions on behalf of all investors, who share in the profits, losses, and expenses proportionally.",
-            "stock": "A stock represents partial ownership in a company, giving shareholders a claim on its assets and earnings. Stocks are bought and sold on stock exchanges, and their value fluctuates based on company performance and market conditions.",
-            "bond": "A bond is a fixed-income investment where an investor loans money to a government or corporation for a set period in exchange for periodic interest payments and the return of the principal amount at maturity.",
-            "401k": "A 401(k) is a retirement savings plan sponsored by an employer, allowing employees to contribute pre-tax income, which grows tax-deferred until withdrawal, typically after retirement.",
-            "ira": "An Individual Retirement Account (IRA) is a tax-advantaged account that helps individuals save for retirement. Traditional IRAs allow tax-deductible contributions, while Roth IRAs offer tax-free withdrawals.",
-            "etf": "An Exchange-Traded Fund (ETF) is an investment fund that holds a collection of securities, such as stocks or bonds, and trades on stock exchanges like a stock. ETFs provide diversification and lower expense ratios compared to mutual funds.",
-            "inflation": "Inflation is the rate at which the general level of prices for goods and services rises over time, reducing the purchasing power of money.",
-            "compound interest": "Compound interest is the process where interest is added to the initial principal amount, and future interest is earned on both the principal and the accumulated interest, leading to exponential growth over time.",
-            "diversification": "Diversification is an investment strategy that involves spreading investments across different asset classes to reduce risk. A well-diversified portfolio minimizes potential losses by avoiding overconcentration in a single asset.",
-            "credit score": "A credit score is a numerical representation of a person’s creditworthiness, based on their credit history, debt levels, and payment behavior. It affects loan approvals, interest rates, and financial opportunities.",
-            "roth ira": "A Roth IRA is a retirement savings account where contributions are made with after-tax income, allowing tax-free withdrawals in retirement, provided certain conditions are met.",
-            "bull market": "A bull market refers to a prolonged period of rising stock prices, often driven by strong economic conditions, investor confidence, and increasing corporate profits.",
-            "bear market": "A bear market is a period when stock prices decline by at least 20% from recent highs, often due to economic downturns, declining investor confidence, or external financial shocks.",
-            "liquidity": "Liquidity refers to how easily an asset can be converted into cash without significantly affecting its price. Cash is the most liquid asset, while real estate and certain investments are less liquid.",
-            "dividend": "A dividend is a portion of a company's earnings distributed to shareholders, usually in cash or additional shares, as a reward for investing in the company.",
-            "portfolio": "A portfolio is a collection of financial assets, such as stocks, bonds, mutual funds, and real estate, that an investor owns. A well-balanced portfolio is key to managing risk and achieving financial goals.",
-            "hedge fund": "A hedge fund is an alternative investment vehicle that pools capital from accredited investors to employ various strategies, such as long-short positions and derivatives, to maximize returns while managing risk.",
-            "private equity": "Private equity refers to investments in privately held companies or buyouts of publicly traded companies, often involving direct investment strategies and active management to improve financial performance.",
-            "venture capital": "Venture capital is a form of private equity financing provided to startups and early-stage companies with high growth potential in exchange for equity ownership.",
-            "asset allocation": "Asset allocation is the process of dividing an investment portfolio among different asset categories, such as stocks, bonds, and cash, to balance risk and reward according to an investor’s goals and risk tolerance.",
-            "market capitalization": "Market capitalization (market cap) is the total value of a company’s outstanding shares, calculated by multiplying the stock price by the number of shares outstanding. It indicates a company's size and market value.",
-            "dollar cost averaging": "Dollar-cost averaging is an investment strategy where an investor regularly invests a fixed amount of money into a particular asset, regardless of its price, reducing the impact of market fluctuations over time.",
-            "index fund": "An index fund is a type of mutual fund or ETF designed to track the performance of a specific market index, such as the S&P 500. It provides broad market exposure and low costs.",
-            "rebalancing": "Rebalancing is the process of adjusting the allocation of assets in an investment portfolio to maintain the desired level of risk and return as market conditions change.",
-            "capital gain": "A capital gain is the profit earned when an asset, such as a stock or real estate, is sold for more than its purchase price. Long-term capital gains often receive favorable tax treatment.",
-            "capital loss": "A capital loss occurs when an asset is sold for less than its purchase price. Capital losses can offset capital gains for tax purposes, reducing taxable income.",
-            "tax-loss harvesting": "Tax-loss harvesting is a strategy where investors sell securities at a loss to offset capital gains, reducing their overall tax liability while maintaining an investment strategy.",
-            "emergency fund": "An emergency fund is a reserve of liquid assets set aside to cover unexpected financial expenses, such as medical emergencies or job loss, providing financial security and stability.",
-            "robo-advisor": "A robo-advisor is an automated platform that provides investment management services using algorithms to create and manage portfolios based on an investor's risk tolerance and goals.",
-            "yield": "Yield refers to the income generated from an investment, typically expressed as a percentage. It includes interest from bonds and dividends from stocks, indicating an investment’s profitability."
- 
-        }
+        # Inverted index from topic word to the topics containing it
+        self._topic_words: Dict[str, set] = {}
+        self._topic_order: Dict[str, int] = {}
+        self._word_index: Dict[str, List[str]] = {}
+        # Topic names grouped by length, so exact names are found by slicing the query
+        self._topics_by_length: Dict[int, set] = {}
+        for topic in self.entries:
+            self._index_topic(topic)
         
-        print("Gossip Girl Financial Bot initialized! Ready to spill the tea on money matters.")
+        self.memory_bytes = self._measure()
     
-    def _load_knowledge_base(self, file_path: str) -> Dict:
-        """Load the financial knowledge base from a JSON file"""
+    def _load_knowledge_base(self, file_path: str, default_entries: Optional[Dict]) -> Dict:
+        """Load the knowledge base from a JSON file"""
         try:
-            with open(file_path, 'r') as file:
-                return json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            # Create default knowledge base with Gossip Girl style
-            default_kb = {
-
-                "mutual fund": "A mutual fund is the ultimate Upper East Side investment clique, darling. Investors pool their money, and a financial Chuck Bass makes all the decisions—stocks, bonds, the whole portfolio. Everyone shares in the wins, the losses, and of course, the management fees. Because even in finance, nothing comes for free.",
-                "stock": "A stock is like holding a VIP pass to a company’s success—own a share, own a piece. The more you have, the more influence you wield, just like Blair Waldorf at Constance. Play it right, and your investment climbs faster than Serena’s social status. But beware, stocks can fall just as fast as they rise.",
-                "bond": "A bond is like lending cash to a government or corporation with the promise of getting paid back—with interest, of course. Less risky than stocks, but also less thrilling—think Nate Archibald over Chuck Bass. Old money adores bonds because they value stability over scandal.",
-                "401k": "A 401(k) is the trust fund you actually have to build yourself. Your employer sets it up, you contribute pre-tax dollars, and it grows until retirement—tax-free, of course. Think of it as securing your future penthouse, because even the elite plan ahead.",
-                "ira": "An IRA is your personal financial safety net, no trust fund required. Choose Traditional to delay taxes, or Roth to pay now and withdraw tax-free later. Either way, it’s like choosing between drama now or drama later—both have their perks.",
-                "etf": "An ETF is like a front-row seat to the stock market’s best players. It’s a mix of investments traded throughout the day—unlike mutual funds, which only trade once. Instant diversification, zero commitment. Sounds a lot like Serena’s dating strategy.",
-                "inflation": "Inflation is the reason your money buys less each year—think of it as designer prices creeping up season after season. Central banks fight it by raising interest rates, but too much control? That’s a fashion disaster waiting to happen.",
-                "compound interest": "Compound interest is the ultimate financial glow-up—earn interest on your interest, and watch your money multiply faster than Gossip Girl rumors. The longer you let it work, the bigger the payoff. Patience, darling, is a wealth-building virtue.",
-                "diversification": "Diversification is the golden rule of investing—never put all your social capital, or money, in one place. Stocks, bonds, real estate—mix it up. If one crashes, the others keep you afloat. The old-money elite have been doing this for generations.",
-                "credit score": "Your credit score is your financial reputation, darling. One bad move—missed payments, too much debt—and it haunts you like a Gossip Girl blast. Keep it high, and doors (and exclusive credit cards) open effortlessly.",
-                "roth ira": "A Roth IRA is like prepaying for luxury now so you can enjoy it tax-free later. You contribute already-taxed income, but future withdrawals? Totally untaxed. The Upper East Side calls that smart planning. New money should take notes.",
-                "bull market": "A bull market is the Wall Street version of Fashion Week—everyone’s thriving, stocks are soaring, and fortunes are multiplying. But like any party, it won’t last forever. The smartest investors know when to step out before the crash.",
-                "bear market": "A bear market is when stock prices drop at least 20%, and suddenly, everyone’s panicking. Think of it as social exile—reputations (and portfolios) take a hit, but the strong always make a comeback. The question is: are you patient enough to wait?",
-                "liquidity": "Liquidity is how quickly you can turn assets into cash—because sometimes, you need an emergency shopping spree at Bergdorf’s. Cash? Instantly liquid. A Hamptons mansion? Not so much. The truly wealthy keep a balance of both.",
-                "dividend": "A dividend is passive income at its finest—companies sharing profits with shareholders like an elite allowance. Old money loves them because they don’t have to lift a finger. Blair Waldorf would definitely approve.",
-                "portfolio": "Your portfolio is your financial wardrobe—diverse, strategic, and tailored to your goals. Stocks for drama, bonds for stability, maybe some real estate for flair. The key? Balance. Even the most fashionable icons mix classic with trendy.",
-                "hedge fund": "A hedge fund is the VIP after-party of investing—exclusive, high-stakes, and only for the wealthy. They use complex strategies to win big, no matter the market. Risky? Absolutely. But the elite never play it safe.",
-                "private equity": "Private equity is next-level investing—buying entire companies instead of just shares. It’s like acquiring a whole fashion empire instead of just a designer handbag. Requires serious money, but the returns? Très chic.",
-                "venture capital": "Venture capital is betting on the next big thing before it’s cool—funding startups in hopes of discovering the next Uber or Instagram. High risk, but if it pays off? You’re looking at generational wealth. Very Bass Industries.",
-                "asset allocation": "Asset allocation is like curating the perfect guest list—balance is key. Stocks for excitement, bonds for stability, and cash for security. The mix depends on your risk tolerance—are you a safe Lily or a bold Chuck?",
-                "market capitalization": "Market cap ranks companies like social status on the Upper East Side. Large caps are the Blairs and Serenas—established, powerful. Mid caps? Nates and Chucks—rising stars. Small caps? Jenny Humphreys—high risk, high reward.",
-                "dollar cost averaging": "Dollar cost averaging is playing the long game—investing steadily instead of all at once. It smooths out the highs and lows, so you’re not caught buying at the worst time. Think of it as effortless, drama-free investing.",
-                "index fund": "An index fund is the ultimate set-it-and-forget-it investment—like letting Dorota handle your social calendar. It tracks the market automatically, has low fees, and delivers solid returns. Even Warren Buffett approves.",
-                "rebalancing": "Rebalancing is the key to maintaining power—er, wealth. Over time, some investments overperform while others lag. Adjusting your portfolio keeps it in check. Even the elite refine their strategies regularly.",
-                "capital gain": "A capital gain is making money off an investment—buy low, sell high, cash in. Hold for over a year, and you get tax perks. The truly wealthy play the long game, just like in high society.",
-                "capital loss": "A capital loss is selling an investment for less than you paid—financial heartbreak, but sometimes useful. You can use it to lower your tax bill. Even a scandal can be spun into something beneficial.",
-                "tax-loss harvesting": "Tax-loss harvesting is using one financial loss to offset another—think of it as damage control. Sell underperforming assets, claim the loss, and reinvest smartly. Even the IRS allows a well-executed redemption arc.",
-                "emergency fund": "An emergency fund is your financial safety net—cash reserves to avoid selling investments or taking on debt when life happens. Old money keeps them, new money forgets. Be old money, darling.",
-                "robo-advisor": "A robo-advisor is like having an algorithm for a financial planner—no emotions, no drama, just automated investing based on your goals. Perfect for those who prefer efficiency over human error.",
-                "yield": "Yield is your investment’s performance score—how much you’re earning from dividends or interest. Higher yield? More rewards, but often more risk. The key is knowing when to go big and when to play it safe."
-
-            }
+            return _load_string_dict(file_path)
+        except (FileNotFoundError, ValueError) as error:
+            # Only the built-in knowledge base has defaults to recreate a missing or malformed file from
+            if default_entries is None:
+                raise RegistryLoadError(f"Could not load knowledge base '{self.name}' from {file_path}: {error}") from error
+            
+            default_kb = dict(default_entries)
             
             # Save the knowledge base to file
             with open(file_path, 'w') as file:
                 json.dump(default_kb, file, indent=4)
             
             return default_kb
+        except OSError as error:
+            raise RegistryLoadError(f"Could not load knowledge base '{self.name}' from {file_path}: {error}") from error
     
-    def _save_knowledge_base(self, file_path: str) -> None:
-        """Save the current knowledge base to the specified file path"""
-        with open(file_path, 'w') as file:
-            json.dump(self.knowledge_base, file, indent=4)
+    def _load_normal_definitions(self, file_path: Optional[str], default_definitions: Optional[Dict]) -> Dict:
+        """Load the plain definitions from a JSON file, or use the defaults if no file is given"""
+        if file_path:
+            try:
+                return _load_string_dict(file_path)
+            except (OSError, ValueError) as error:
+                raise RegistryLoadError(f"Could not load normal definitions for '{self.name}' from {file_path}: {error}") from error
+        return dict(default_definitions or {})
     
-    def _find_best_match(self, query: str) -> Tuple[str, float]:
+    def _save_knowledge_base(self) -> None:
+        """Save the current knowledge base to its file path"""
+        with open(self.path, 'w') as file:
+            json.dump(self.entries, file, indent=4)
+    
+    def _index_topic(self, topic: str) -> None:
+        """Add a topic to the word and length indexes"""
+        if topic in self._topic_words:
+            return
+        topic_words = set(re.findall(r'\w+', topic))
+        self._topic_words[topic] = topic_words
+        self._topic_order[topic] = len(self._topic_order)
+        self._topics_by_length.setdefault(len(topic), set()).add(topic)
+        for word in topic_words:
+            self._word_index.setdefault(word, []).append(topic)
+    
+    def _measure(self) -> int:
+        """Approximate memory used by the topics, definitions and indexes, in bytes"""
+        seen = set()
+        return sum(_estimate_size(part, seen) for part in
+                   (self.entries, self.normal_definitions, self._topic_words, self._topic_order,
+                    self._word_index, self._topics_by_length))
+    
+    def find_best_match(self, query: str) -> Tuple[str, float]:
         """Find the best matching topic for the given query"""
         query = query.lower()
         best_match = None
         highest_score = 0
         
-        # Simple keyword matching
-        for topic, description in self.knowledge_base.items():
-            if topic in query:
+        with self._lock:
+            # Look up every slice of the query whose length matches some topic name
+            exact_matches = [
+                query[start:start + length]
+                for length, topics in self._topics_by_length.items()
+                for start in range(len(query) - length + 1)
+                if query[start:start + length] in topics
+            ]
+            if exact_matches:
                 # If exact topic name is in the query, that's a strong match
-                return topic, 0.9
+                return min(exact_matches, key=self._topic_order.get), 0.9
             
-            # Calculate word overlap between query and topic
-            topic_words = set(re.findall(r'\w+', topic))
+            # Count word overlap only for topics sharing a word with the query
             query_words = set(re.findall(r'\w+', query))
-            common_words = topic_words.intersection(query_words)
+            common_counts: Dict[str, int] = {}
+            for word in query_words:
+                for topic in self._word_index.get(word, ()):
+                    common_counts[topic] = common_counts.get(topic, 0) + 1
             
-            if common_words:
-                score = len(common_words) / len(topic_words)
+            # Ties go to the earliest topic, as in a scan over the knowledge base
+            for topic in sorted(common_counts, key=self._topic_order.get):
+                score = common_counts[topic] / len(self._topic_words[topic])
                 if score > highest_score:
                     highest_score = score
                     best_match = topic
         
         return best_match, highest_score
     
+    def _add_topic(self, topic: str, description: str) -> None:
+        """
+        Add or replace a topic and persist the knowledge base
+        
+        Call KnowledgeBaseRegistry.add_topic instead, so the write always lands on the
+        copy the registry holds and never on one that has already been evicted
+        """
+        with self._lock:
+            self.entries[topic] = description
+            self._index_topic(topic)
+            self._save_knowledge_base()
+            self.memory_bytes = self._measure()
+    
+    def get_all_topics(self) -> List[str]:
+        """Return all topics in this knowledge base"""
+        with self._lock:
+            return sorted(list(self.entries.keys()))
+
+class KnowledgeBaseRegistry:
+    def __init__(self, memory_budget_bytes: int):
+        """
+        Registry of named knowledge bases, loaded on first use
+        
+        Args:
+            memory_budget_bytes: Total size loaded knowledge bases may use before idle ones are evicted
+        """
+        self.memory_budget_bytes = memory_budget_bytes
+        self._sources: Dict[str, Dict] = {}
+        self._loaded: "OrderedDict[str, KnowledgeBase]" = OrderedDict()
+        self._last_used: Dict[str, float] = {}
+        self._errors: Dict[str, RegistryLoadError] = {}
+        self._lock = threading.Lock()
+    
+    def register(self, name: str, path: str, normal_definitions_path: Optional[str] = None,
+                 default_entries: Optional[Dict] = None, default_normal_definitions: Optional[Dict] = None) -> None:
+        """Register a knowledge base without loading it"""
+        with self._lock:
+            self._sources[name] = {
+                'path': path,
+                'normal_definitions_path': normal_definitions_path,
+                'default_entries': default_entries,
+                'default_normal_definitions': default_normal_definitions,
+            }
+            # Re-registering replaces any copy loaded from the old source
+            self._loaded.pop(name, None)
+            self._errors.pop(name, None)
+    
+    def _get_loaded(self, name: str) -> KnowledgeBase:
+        """Return the loaded copy of a knowledge base, loading it if needed; the caller holds the lock"""
+        if name not in self._sources:
+            raise KeyError(name)
+        knowledge_base = self._loaded.get(name)
+        if knowledge_base is None:
+            # A failed load is retried on the next request; the latest error is kept for the report
+            try:
+                knowledge_base = KnowledgeBase(name, **self._sources[name])
+            except RegistryLoadError as error:
+                print(error)
+                self._errors[name] = error
+                raise
+            self._errors.pop(name, None)
+            self._loaded[name] = knowledge_base
+        self._loaded.move_to_end(name)
+        self._last_used[name] = time.time()
+        return knowledge_base
+    
+    def get(self, name: str) -> KnowledgeBase:
+        """
+        Return the named knowledge base, loading it and evicting idle ones if needed
+        
+        Raises:
+            KeyError: If no knowledge base is registered under the name
+            RegistryLoadError: If the knowledge base's files cannot be loaded
+        """
+        with self._lock:
+            knowledge_base = self._get_loaded(name)
+            self._evict_idle()
+            return knowledge_base
+    
+    def add_topic(self, name: str, topic: str, description: str) -> None:
+        """
+        Add a topic to the named knowledge base and persist it
+        
+        The write goes to the copy the registry currently holds, under the registry lock,
+        so a copy evicted and reloaded in the meantime can never overwrite it
+        """
+        with self._lock:
+            self._get_loaded(name)._add_topic(topic, description)
+            # The knowledge base just grew, so the budget may now be exceeded
+            self._evict_idle()
+    
+    def _evict_idle(self) -> None:
+        """Drop least recently used knowledge bases until the loaded ones fit the budget"""
+        total = sum(knowledge_base.memory_bytes for knowledge_base in self._loaded.values())
+        # The most recently used knowledge base is never evicted
+        while total > self.memory_budget_bytes and len(self._loaded) > 1:
+            _, evicted = self._loaded.popitem(last=False)
+            total -= evicted.memory_bytes
+    
+    def memory_report(self) -> List[Dict]:
+        """Report whether each knowledge base is loaded, how much memory it uses and any load error"""
+        with self._lock:
+            return [{
+                'name': name,
+                'loaded': name in self._loaded,
+                'memory_bytes': self._loaded[name].memory_bytes if name in self._loaded else 0,
+                'last_used': self._last_used.get(name),
+                'error': str(self._errors[name]) if name in self._errors else None,
+            } for name in sorted(self._sources)]
+
+class Persona:
+    def __init__(self, name: str, intros: List[str], outros: List[str], greeting: str,
+                 farewell: str, default_responses: List[str]):
+        """
+        A persona style pack used for the "gossip" response style
+        
+        Args:
+            name: Name the persona is registered under
+            intros: Phrases one of which opens each styled response
+            outros: Phrases one of which closes each styled response
+            greeting: Reply to a greeting
+            farewell: Reply to a farewell
+            default_responses: Replies when no topic matches
+        """
+        self.name = name
+        self.intros = intros
+        self.outros = outros
+        self.greeting = greeting
+        self.farewell = farewell
+        self.default_responses = default_responses
+    
+    @classmethod
+    def from_file(cls, name: str, file_path: str) -> "Persona":
+        """
+        Load a persona from a JSON file; missing keys fall back to the Gossip Girl persona
+        
+        Raises:
+            RegistryLoadError: If the file cannot be read or does not describe a persona
+        """
+        try:
+            with open(file_path, 'r') as file:
+                style = json.load(file)
+            if not isinstance(style, dict):
+                raise ValueError("expected a JSON object")
+            unknown_keys = set(style) - set(DEFAULT_PERSONA)
+            if unknown_keys:
+                raise ValueError(f"unknown keys {sorted(unknown_keys)}")
+            
+            fields = {key: style.get(key, value) for key, value in DEFAULT_PERSONA.items()}
+            for key, value in fields.items():
+                if isinstance(DEFAULT_PERSONA[key], list):
+                    if not isinstance(value, list) or not value or not all(isinstance(item, str) for item in value):
+                        raise ValueError(f"'{key}' must be a non-empty list of strings")
+                elif not isinstance(value, str):
+                    raise ValueError(f"'{key}' must be a string")
+        except (OSError, ValueError) as error:
+            raise RegistryLoadError(f"Could not load persona '{name}' from {file_path}: {error}") from error
+        return cls(name, **fields)
+    
+    def add_flair(self, response: str) -> str:
+        """Wrap a response in this persona's intro and outro"""
+        intro = random.choice(self.intros)
+        outro = random.choice(self.outros)
+        return f"{intro}{response}{outro}"
+
+class PersonaRegistry:
+    def __init__(self):
+        """Registry of named persona style packs, loaded on first use"""
+        self._sources: Dict[str, str] = {}
+        self._loaded: Dict[str, Persona] = {}
+        self._errors: Dict[str, RegistryLoadError] = {}
+        self._lock = threading.Lock()
+    
+    def register(self, persona: Persona) -> None:
+        """Register an already built persona"""
+        with self._lock:
+            self._sources.pop(persona.name, None)
+            self._errors.pop(persona.name, None)
+            self._loaded[persona.name] = persona
+    
+    def register_file(self, name: str, file_path: str) -> None:
+        """Register a persona stored in a JSON file without loading it"""
+        with self._lock:
+            self._sources[name] = file_path
+            self._loaded.pop(name, None)
+            self._errors.pop(name, None)
+    
+    def get(self, name: str) -> Persona:
+        """
+        Return the named persona, loading it if needed
+        
+        Raises:
+            KeyError: If no persona is registered under the name
+            RegistryLoadError: If the persona's file cannot be loaded
+        """
+        with self._lock:
+            if name not in self._loaded:
+                if name not in self._sources:
+                    raise KeyError(name)
+                # A failed load is retried on the next request; the latest error is kept for the report
+                try:
+                    self._loaded[name] = Persona.from_file(name, self._sources[name])
+                except RegistryLoadError as error:
+                    print(error)
+                    self._errors[name] = error
+                    raise
+                self._errors.pop(name, None)
+            return self._loaded[name]
+    
+    def report(self) -> List[Dict]:
+        """Report whether each persona is loaded and any load error"""
+        with self._lock:
+            return [{
+                'name': name,
+                'loaded': name in self._loaded,
+                'error': str(self._errors[name]) if name in self._errors else None,
+            } for name in sorted(set(self._sources) | set(self._loaded))]
+
+class GossipGirlFinanceBot:
+    def __init__(self, knowledge_base_path: str = "financial_knowledge.json",
+                 registry_config_path: Optional[str] = REGISTRY_CONFIG_PATH,
+                 memory_budget_mb: float = KB_MEMORY_BUDGET_MB):
+        """
+        Initialize the Gossip Girl-themed Financial Chatbot
+        
+        Args:
+            knowledge_base_path: Path to the JSON file containing the default financial information
+            registry_config_path: Optional JSON file registering extra knowledge bases and personas
+            memory_budget_mb: Memory budget for loaded knowledge bases, in megabytes
+        """
+        self.knowledge_bases = KnowledgeBaseRegistry(int(memory_budget_mb * 1024 * 1024))
+        self.knowledge_bases.register(DEFAULT_KNOWLEDGE_BASE_NAME, knowledge_base_path,
+                                      default_entries=DEFAULT_KNOWLEDGE_BASE,
+                                      default_normal_definitions=DEFAULT_NORMAL_DEFINITIONS)
+        
+        self.personas = PersonaRegistry()
+        self.personas.register(Persona(DEFAULT_PERSONA_NAME, **DEFAULT_PERSONA))
+        
+        # Problems found in the registry config file, reported by /knowledge_bases
+        self.registry_config_errors: List[str] = []
+        if registry_config_path and os.path.exists(registry_config_path):
+            self._load_registry_config(registry_config_path)
+        
+        # Initialize greeting and farewell phrases
+        self.greeting_phrases = ["hello", "hi", "hey", "greetings", "howdy"]
+        self.farewell_phrases = ["bye", "goodbye", "exit", "quit", "see you"]
+        
+        print("Gossip Girl Financial Bot initialized! Ready to spill the tea on money matters.")
+    
+    def _load_registry_config(self, file_path: str) -> None:
+        """
+        Register the knowledge bases and personas listed in a JSON config file
+        
+        The file looks like:
+            {
+                "knowledge_bases": {"retirement": {"path": "retirement.json", "normal_definitions": "retirement_normal.json"}},
+                "personas": {"wall street": "wall_street_persona.json"}
+            }
+        
+        Bad entries are skipped and recorded in registry_config_errors rather than stopping the app
+        """
+        try:
+            with open(file_path, 'r') as file:
+                config = json.load(file)
+        except (OSError, ValueError) as error:
+            self._report_config_error(f"Could not read registry config {file_path}: {error}")
+            return
+        
+        if not isinstance(config, dict):
+            self._report_config_error(f"Registry config {file_path} must contain a JSON object")
+            return
+        
+        knowledge_bases = config.get('knowledge_bases', {})
+        if not isinstance(knowledge_bases, dict):
+            self._report_config_error("'knowledge_bases' must be a JSON object")
+            knowledge_bases = {}
+        for name, source in knowledge_bases.items():
+            if not isinstance(source, dict) or not isinstance(source.get('path'), str):
+                self._report_config_error(f"Knowledge base '{name}' needs a \"path\" string")
+                continue
+            normal_definitions = source.get('normal_definitions')
+            if normal_definitions is not None and not isinstance(normal_definitions, str):
+                self._report_config_error(f"Knowledge base '{name}' has a \"normal_definitions\" that is not a string")
+                continue
+            self.knowledge_bases.register(name, source['path'], normal_definitions)
+        
+        personas = config.get('personas', {})
+        if not isinstance(personas, dict):
+            self._report_config_error("'personas' must be a JSON object")
+            personas = {}
+        for name, persona_path in personas.items():
+            if not isinstance(persona_path, str):
+                self._report_config_error(f"Persona '{name}' must map to a file path string")
+                continue
+            self.personas.register_file(name, persona_path)
+    
+    def _report_config_error(self, message: str) -> None:
+        """Record and print a problem found in the registry config file"""
+        print(message)
+        self.registry_config_errors.append(message)
+    
     def _is_greeting(self, message: str) -> bool:
         """Check if the message is a greeting"""
         return any(phrase in message.lower() for phrase in self.greeting_phrases)
@@ -179,16 +594,16 @@ class GossipGirlFinanceBot:
         """
         if len(context.split()) < 100:  # For short contexts, just return as is
             return context
-            
+        
         try:
-            result = self.qa_pipeline(question=query, context=context)
+            result = get_qa_pipeline()(question=query, context=context)
             if result['score'] < 0.5:
                 return context
             return result['answer']
         except:
             return context
     
-    def _process_learning_request(self, message: str) -> str:
+    def _process_learning_request(self, message: str, knowledge_base: str) -> str:
         """Process a request to teach the chatbot new information"""
         pattern = r"(?:learn|add|teach) (?:that|about) ([a-z0-9 ]+) (?:is|are|means) (.+)"
         match = re.search(pattern, message.lower())
@@ -201,70 +616,71 @@ class GossipGirlFinanceBot:
             gossip_definition = f"{definition} And that's a financial secret even I didn't know until now. The elite of Manhattan would pay good money for this kind of insider knowledge."
             
             # Add to knowledge base
-            self.knowledge_base[topic] = gossip_definition
-            self._save_knowledge_base("financial_knowledge.json")
+            self.knowledge_bases.add_topic(knowledge_base, topic, gossip_definition)
             
             return f"Spotted: New financial intel entering my database. {topic} is {definition} XOXO, you know you love teaching me."
         
         return "Even Gossip Girl needs clear information. Try using the format: 'Learn that [topic] is [definition]'"
     
-    def get_all_topics(self) -> List[str]:
+    def get_all_topics(self, knowledge_base: str = DEFAULT_KNOWLEDGE_BASE_NAME) -> List[str]:
         """Return all available financial topics"""
-        return sorted(list(self.knowledge_base.keys()))
+        return self.knowledge_bases.get(knowledge_base).get_all_topics()
     
-    def add_gossip_girl_flair(self, response: str) -> str:
+    def add_gossip_girl_flair(self, response: str, persona: str = DEFAULT_PERSONA_NAME) -> str:
         """Add Gossip Girl style to a response"""
-        intro = random.choice(self.gossip_intros)
-        outro = random.choice(self.gossip_outros)
-        final_response = f"{intro}{response}{outro}"
-        return final_response
+        return self.personas.get(persona).add_flair(response)
     
-    def respond(self, message: str, style: str = "gossip") -> str:
+    def respond(self, message: str, style: str = "gossip", knowledge_base: str = DEFAULT_KNOWLEDGE_BASE_NAME,
+                persona: str = DEFAULT_PERSONA_NAME) -> str:
         """
         Generate a response for the user's query
         
         Args:
             message: The user's message
             style: The style of response ("gossip" or "normal")
+            knowledge_base: Name of the registered knowledge base to answer from
+            persona: Name of the registered persona used for the "gossip" style
+        
+        Raises:
+            KeyError: If the knowledge base, or for the "gossip" style the persona, is not registered
+            RegistryLoadError: If the knowledge base, or for the "gossip" style the persona, cannot be loaded
         """
+        kb = self.knowledge_bases.get(knowledge_base)
+        # The normal style never uses the persona, so it is only looked up for gossip
+        style_pack = self.personas.get(persona) if style == "gossip" else None
+        
         # Check for special commands
         if self._is_greeting(message):
-            greeting_response = "Hello there! I'm your exclusive source into the scandalous lives of financial terms. What money gossip can I spill today?"
-            return self.add_gossip_girl_flair(greeting_response) if style == "gossip" else greeting_response
+            greeting_response = style_pack.greeting if style == "gossip" else DEFAULT_PERSONA["greeting"]
+            return style_pack.add_flair(greeting_response) if style == "gossip" else greeting_response
         
         if self._is_farewell(message):
-            return "You know you'll miss me. Until next time, XOXO, Financial Girl." if style == "gossip" else "Goodbye! Feel free to come back with more financial questions."
+            return style_pack.farewell if style == "gossip" else "Goodbye! Feel free to come back with more financial questions."
         
         # Check if the user is trying to teach the chatbot
         if re.search(r"(?:learn|add|teach)", message.lower()):
-            return self._process_learning_request(message)
+            return self._process_learning_request(message, knowledge_base)
         
         # Find best matching topic
-        best_match, confidence = self._find_best_match(message)
+        best_match, confidence = kb.find_best_match(message)
         
         if best_match and confidence > 0.3:
             # Get the appropriate definition based on style
-            if style == "normal" and best_match in self.normal_definitions:
-                return self.normal_definitions[best_match]
+            if style == "normal" and best_match in kb.normal_definitions:
+                return kb.normal_definitions[best_match]
             elif style == "gossip":
-                context = self.knowledge_base[best_match]
+                context = kb.entries[best_match]
                 answer = self._generate_answer(message, context)
-                return self.add_gossip_girl_flair(answer)
+                return style_pack.add_flair(answer)
             else:
                 # Fallback to gossip style if normal isn't available
-                context = self.knowledge_base[best_match]
+                context = kb.entries[best_match]
                 answer = self._generate_answer(message, context)
-                return self.add_gossip_girl_flair(answer) if style == "gossip" else answer
+                return style_pack.add_flair(answer) if style == "gossip" else answer
         
         # Default response
         if style == "gossip":
-            default_responses = [
-                "Even Gossip Girl doesn't have all the financial tea on that. Try asking about specific terms like 'robo-advisor' or 'yield'. I promise the scandal is worth it.",
-                "That's not in my financial diary yet. I'm more versed in terms like 'robo-advisor' or 'yield'. Ask me about those instead, and I'll spill all the details.",
-                "That financial query is more mysterious than Gossip Girl's identity. Try something like 'What is yield?' or 'Tell me about robo-advisors' instead.",
-                "That's not trending in my financial circles yet. But I have plenty of gossip on 'robo-advisors' or 'yield' if you're interested."
-            ]
-            return random.choice(default_responses)
+            return random.choice(style_pack.default_responses)
         else:
             return "I don't have information on that topic. Try asking about 'robo-advisor' or 'yield' instead."
 
@@ -274,8 +690,23 @@ chatbot = GossipGirlFinanceBot()
 @app.route('/')
 def home():
     """Render the home page"""
-    topics = chatbot.get_all_topics()
-    return render_template('index.html', topics=topics)
+    knowledge_base = request.args.get('knowledge_base', DEFAULT_KNOWLEDGE_BASE_NAME)
+    persona = request.args.get('persona', DEFAULT_PERSONA_NAME)
+    # Unknown or broken knowledge bases and personas fall back to the defaults
+    try:
+        topics = chatbot.get_all_topics(knowledge_base)
+    except (KeyError, RegistryLoadError):
+        knowledge_base = DEFAULT_KNOWLEDGE_BASE_NAME
+        try:
+            topics = chatbot.get_all_topics(knowledge_base)
+        except RegistryLoadError:
+            # Still render the page; /ask reports the error and retries the load
+            topics = []
+    try:
+        chatbot.personas.get(persona)
+    except (KeyError, RegistryLoadError):
+        persona = DEFAULT_PERSONA_NAME
+    return render_template('index.html', topics=topics, knowledge_base=knowledge_base, persona=persona)
 
 @app.route('/ask', methods=['POST'])
 def ask():
@@ -283,13 +714,30 @@ def ask():
     data = request.get_json()
     user_message = data.get('message', '')
     style = data.get('style', 'gossip')  # Default to gossip style
+    knowledge_base = data.get('knowledge_base') or DEFAULT_KNOWLEDGE_BASE_NAME
+    persona = data.get('persona') or DEFAULT_PERSONA_NAME
     
     if not user_message:
         return jsonify({'response': 'Please enter a question, darling.'})
     
-    response = chatbot.respond(user_message, style)
+    try:
+        response = chatbot.respond(user_message, style, knowledge_base, persona)
+    except KeyError as error:
+        return jsonify({'response': f"Even Gossip Girl has never heard of {error.args[0]}, darling."}), 404
+    except RegistryLoadError as error:
+        return jsonify({'response': "Even Gossip Girl's sources sometimes go dark. Try again later.", 'error': str(error)}), 500
     return jsonify({'response': response})
 
+@app.route('/knowledge_bases')
+def knowledge_bases():
+    """Report registered knowledge bases and personas with their memory footprint and load errors"""
+    return jsonify({
+        'knowledge_bases': chatbot.knowledge_bases.memory_report(),
+        'memory_budget_bytes': chatbot.knowledge_bases.memory_budget_bytes,
+        'personas': chatbot.personas.report(),
+        'config_errors': chatbot.registry_config_errors,
+    })
+
 if __name__ == "__main__":
     # Create templates directory if it doesn't exist
     if not os.path.exists('templates'):
@@ -622,7 +1070,9 @@ if __name__ == "__main__":
                         contentType: 'application/json',
                         data: JSON.stringify({ 
                             message: message,
-                            style: style
+                            style: style,
+                            knowledge_base: {{ knowledge_base|tojson }},
+                            persona: {{ persona|tojson }}
                         }),
                         success: function(response) {
                             // Remove typing indicator